@@ -149,7 +149,6 @@ class Compiler:
         hash: str = self.members_hash(entity.path, entity.name, types_signature)
 
         types_inferred: bool = updated_types is not None
-        decorator_inferred: bool = updated_decorator is not None
 
         if types_inferred and entity.style not in {PyKokkosStyles.workunit, PyKokkosStyles.fused}:
             raise Exception(f"Types are required for style: {entity.style}")
@@ -159,10 +158,7 @@ class Compiler:
                 if len(metadata) > 1:
                     entity, classtypes = self.fuse_objects(metadata, fuse_ASTs=True, **kwargs)
 
-                if types_inferred:
-                    entity.AST = parser.fix_types(entity, updated_types)
-                if decorator_inferred:
-                    entity.AST = parser.fix_decorator(entity, updated_decorator)
+                self.fix_entity(parser, entity, updated_types, updated_decorator)
                 self.members[hash] = self.extract_members(entity, classtypes)
 
             return self.members[hash]
@@ -174,10 +170,7 @@ class Compiler:
 
         members: PyKokkosMembers
 
-        if types_inferred:
-            entity.AST = parser.fix_types(entity, updated_types)
-        if decorator_inferred:
-            entity.AST = parser.fix_decorator(entity, updated_decorator)
+        self.fix_entity(parser, entity, updated_types, updated_decorator)
 
         if hash in self.members: # True if compiled with another execution space
             members = self.members[hash]
@@ -188,6 +181,51 @@ class Compiler:
         self.compile_entity(module_setup.main, module_setup, entity, classtypes, space, force_uvm, members, restrict_views)
         return members
 
+    def fix_entity(
+        self,
+        parser: Parser,
+        entity: PyKokkosEntity,
+        updated_types: Optional[UpdatedTypes],
+        updated_decorator: Optional[UpdatedDecorator]
+    ) -> None:
+        """
+        Inject the inferred types and decorator specifiers into the AST
+        of the entity
+
+        :param parser: the parser of the entity
+        :param entity: the entity being compiled
+        :param updated_types: Object with with inferred types
+        :param updated_decorator: Object for decorator specifiers
+        """
+
+        if updated_types is not None:
+            entity.AST = parser.fix_types(entity, updated_types)
+        if updated_decorator is not None:
+            entity.AST = parser.fix_decorator(entity, updated_decorator)
+
+        # The AST was modified in place
+        if updated_types is not None or updated_decorator is not None:
+            StaticTranslator.invalidate_parent_refs(entity.AST)
+
+    def optimize_entity(self, entity: PyKokkosEntity) -> None:
+        """
+        Apply the AST optimizations enabled through environment
+        variables to a workunit
+
+        :param entity: the entity being compiled
+        """
+
+        if entity.style not in {PyKokkosStyles.workunit, PyKokkosStyles.fused}:
+            return
+
+        if "PK_LOOP_FUSE" in os.environ:
+            loop_fuse(entity.AST)
+        if "PK_MEM_FUSE" in os.environ:
+            memory_ops_fuse(entity.AST, entity.pk_import)
+
+        # The AST was modified in place
+        StaticTranslator.invalidate_parent_refs(entity.AST)
+
     def compile_entity(
         self,
         main: Path,
@@ -228,11 +266,7 @@ class Compiler:
         bindings: List[str]
         cast: List[str]
 
-        if entity.style in {PyKokkosStyles.workunit, PyKokkosStyles.fused}:
-            if "PK_LOOP_FUSE" in os.environ:
-                loop_fuse(entity.AST)
-            if "PK_MEM_FUSE" in os.environ:
-                memory_ops_fuse(entity.AST, entity.pk_import)
+        self.optimize_entity(entity)
         functor, bindings, cast = translator.translate(entity, classtypes, restrict_views)
 
         t_end: float = time.perf_counter() - t_start
@@ -1,5 +1,6 @@
+from .clone import fast_clone
 from .decl import *
 from .expr import *
-from .node import Node
+from .node import Node, intern_name
 from .serializer import Serializer
 from .stmt import *
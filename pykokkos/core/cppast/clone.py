@@ -0,0 +1,55 @@
+import copy
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from .node import Node
+
+
+_ATOMIC_TYPES = (str, int, float, bool, type(None), Enum)
+
+
+def fast_clone(obj: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
+    """
+    Deep copy a cppast tree (or containers of cppast nodes) without
+    going through copy.deepcopy(). Nodes are rebuilt from their
+    instance dict directly. Like deepcopy, objects are memoized by id()
+    so that a node shared by several parents is copied only once
+
+    :param obj: the object to copy
+    :param memo: maps from the id() of each copied object to its copy
+    :returns: the copy
+    """
+
+    if isinstance(obj, _ATOMIC_TYPES):
+        return obj
+
+    if memo is None:
+        memo = {}
+
+    obj_id: int = id(obj)
+    if obj_id in memo:
+        return memo[obj_id]
+
+    new: Any
+    if isinstance(obj, Node):
+        cls = obj.__class__
+        new = cls.__new__(cls)
+        memo[obj_id] = new
+        new.__dict__.update({k: fast_clone(v, memo) for k, v in obj.__dict__.items()})
+    elif type(obj) is list:
+        new = []
+        memo[obj_id] = new
+        new.extend(fast_clone(o, memo) for o in obj)
+    elif type(obj) is dict:
+        new = {}
+        memo[obj_id] = new
+        for k, v in obj.items():
+            new[fast_clone(k, memo)] = fast_clone(v, memo)
+    elif type(obj) is tuple:
+        new = tuple(fast_clone(o, memo) for o in obj)
+        memo[obj_id] = new
+    else:
+        new = copy.deepcopy(obj, memo)
+        memo[obj_id] = new
+
+    return new
@@ -3,7 +3,7 @@ from abc import abstractmethod
 from enum import Enum
 from typing import List, Optional, TYPE_CHECKING, Union
 
-from .node import Node
+from .node import Node, intern_name
 if TYPE_CHECKING:
     from .expr import DeclRefExpr, Expr
     from .stmt import Stmt
@@ -49,7 +49,7 @@ class PrimitiveType(Type):
     """Represents types in BuiltInType"""
 
     def __init__(self, built_in_type: Union[BuiltinType, str]):
-        self._type: Union[BuiltinType, str] = built_in_type
+        self._type: Union[BuiltinType, str] = intern_name(built_in_type)
         self._is_reference: bool = False
 
     @property
@@ -69,7 +69,7 @@ class ClassType(Type):
     """Represents C++ class types"""
 
     def __init__(self, typename: str):
-        self._typename: str = typename
+        self._typename: str = intern_name(typename)
         self._is_reference: bool = False
         self._template_params: List[Node] = []
 
@@ -79,7 +79,7 @@ class ClassType(Type):
 
     @typename.setter
     def typename(self, value: str) -> None:
-        self._typename = value
+        self._typename = intern_name(value)
 
     @property
     def is_reference(self) -> bool:
@@ -3,7 +3,7 @@ from abc import abstractmethod
 from enum import Enum
 from typing import List, TYPE_CHECKING, Union
 
-from .node import Node
+from .node import Node, intern_name
 from .stmt import ValueStmt
 if TYPE_CHECKING:
     from .decl import ParmVarDecl, Type, ValueDecl
@@ -65,7 +65,7 @@ class DeclRefExpr(Expr):
     """Represents a reference to a declared variable, function, etc."""
 
     def __init__(self, declname: str):
-        self._declname: str = declname
+        self._declname: str = intern_name(declname)
 
     @property
     def declname(self) -> str:
@@ -74,7 +74,7 @@ class DeclRefExpr(Expr):
     def add_length(self, length: int) -> None:
         """Used by array types"""
 
-        self._declname += f"[{length}]"
+        self._declname = intern_name(f"{self._declname}[{length}]")
 
     def __hash__(self) -> int:
         return hash(self._declname)
@@ -1,4 +1,17 @@
+import sys
+from typing import Any
+
+
 class Node:
     """The base class of all nodes in the AST"""
 
     ...
+
+
+def intern_name(name: Any) -> Any:
+    """
+    Intern identifier and type names so that the many nodes referring
+    to the same symbol share a single string
+    """
+
+    return sys.intern(name) if type(name) is str else name
@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import Callable, Dict, List, Union
 
 from .decl import (
     BuiltinType, ClassType, ConstructorDecl, FieldDecl, FunctionDecl, MethodDecl,
@@ -18,18 +18,23 @@ from .stmt import (
 
 
 class Serializer:
-    def __init__(self):
-        ...
+    def __init__(self) -> None:
+        # Maps from node class to its serialize_* method, filled lazily
+        self._dispatch: Dict[type, Callable[[Node], str]] = {}
 
     def serialize(self, node: Node) -> str:
         """Serialize a node"""
-        method: str = f"serialize_{node.__class__.__name__}"
+        serializer = self._dispatch.get(node.__class__)
+        if serializer is None:
+            method: str = f"serialize_{node.__class__.__name__}"
 
-        try:
-            serializer = getattr(self, method)
-        except AttributeError:
-            raise NotImplementedError(
-                f"Method {method} has not been implemented")
+            try:
+                serializer = getattr(self, method)
+            except AttributeError:
+                raise NotImplementedError(
+                    f"Method {method} has not been implemented")
+
+            self._dispatch[node.__class__] = serializer
 
         return serializer(node)
 
@@ -280,18 +280,21 @@ def add_parent_refs(classdef: ast.ClassDef) -> ast.ClassDef:
     :returns: the modified classdef
     """
 
-    for node in ast.walk(classdef):
-        for child in ast.iter_child_nodes(node):
-            child.parent = node
-
+    stack: List[ast.AST] = [classdef]
+    while stack:
+        node = stack.pop()
         for field_name, child in ast.iter_fields(node):
             if isinstance(child, ast.AST):
+                child.parent = node
                 child.parent_accessor = field_name
+                stack.append(child)
             elif isinstance(child, list):
                 for idx, grand_child in enumerate(child):
-                    if isinstance(grand_child, str):
+                    if not isinstance(grand_child, ast.AST):
                         continue
+                    grand_child.parent = node
                     grand_child.parent_accessor = field_name
                     grand_child.idx_in_parent = idx
+                    stack.append(grand_child)
 
     return classdef
@@ -1,2 +1,2 @@
 from .members import PyKokkosMembers
-from .static import StaticTranslator
+from .static import StaticTranslator, TranslatorError
@@ -0,0 +1,147 @@
+import ast
+import functools
+import hashlib
+import itertools
+import os
+from pathlib import Path
+import pickle
+import tempfile
+from typing import List, Optional, Set, Tuple
+
+from pykokkos.core.parsers import PyKokkosEntity
+
+from .members import PyKokkosMembers
+
+
+CACHE_DIR: Path = Path.home() / ".pykokkos" / "translator_cache"
+
+# (functor, bindings, cast)
+Translation = Tuple[List[str], List[str], List[str]]
+
+
+def is_enabled() -> bool:
+    """
+    Check whether the on-disk translation cache should be used. The
+    cache is never evicted, so it is only used when explicitly enabled
+
+    :returns: true if PK_TRANSLATOR_CACHE is set
+    """
+
+    return "PK_TRANSLATOR_CACHE" in os.environ
+
+
+@functools.lru_cache(maxsize=None)
+def get_translator_version() -> bytes:
+    """
+    Get a fingerprint of the translator source code so that cached
+    translations are invalidated whenever PyKokkos itself changes
+
+    :returns: the modification times of all core and interface source files
+    """
+
+    # The visitors also depend on the interface (View, TeamMember, dtypes, ...)
+    package_dir: Path = Path(__file__).resolve().parents[2]
+    sources: List[Path] = sorted(
+        [*(package_dir / "core").rglob("*.py"), *(package_dir / "interface").rglob("*.py")])
+    mtimes: List[str] = [f"{p}:{p.stat().st_mtime_ns}" for p in sources]
+
+    return "|".join(mtimes).encode()
+
+
+def get_cache_key(
+    entity: PyKokkosEntity,
+    members: PyKokkosMembers,
+    classtypes: List[PyKokkosEntity],
+    restrict_views: Set[str],
+    output_files: Tuple[str, str, str]
+) -> str:
+    """
+    Hash everything that the translation of an entity depends on
+
+    :param entity: the entity being translated
+    :param members: the PyKokkos related members of the entity
+    :param classtypes: the list of classtypes needed by the entity
+    :param restrict_views: the views with the restrict keyword
+    :param output_files: the names of the module, functor, and functor cast files
+    :returns: the hex digest identifying the translation
+    """
+
+    h = hashlib.blake2b()
+
+    # The AST is hashed in addition to the source since type and
+    # decorator inference as well as fusion modify it in place
+    h.update(get_translator_version())
+    h.update(f"{entity.name}|{entity.style}|{entity.pk_import}".encode())
+    h.update("\n".join(entity.source[0]).encode())
+    h.update(ast.dump(entity.AST).encode())
+
+    # Every AST visited by the translator, some of which (e.g. the
+    # functions called by a workunit) are not part of entity.AST
+    ASTs = itertools.chain(
+        members.pk_mains.values(),
+        members.pk_workunits.values(),
+        members.pk_functions.values(),
+        (c.AST for c in classtypes)
+    )
+    for AST in ASTs:
+        h.update(b"|")
+        h.update(ast.dump(AST).encode())
+
+    h.update("|".join(sorted(restrict_views)).encode())
+    h.update("|".join(output_files).encode())
+    h.update(str("PK_RESTRICT" in os.environ).encode())
+
+    return h.hexdigest()
+
+
+def load(key: str) -> Optional[Translation]:
+    """
+    Load a cached translation. Like store(), any failure is treated as
+    a cache miss since the cache is only an optimization
+
+    :param key: the key returned by get_cache_key()
+    :returns: the cached translation or None if it does not exist or
+        is not a valid translation
+    """
+
+    path: Path = CACHE_DIR / f"{key}.pkl"
+
+    try:
+        with open(path, "rb") as f:
+            translation = pickle.load(f)
+    except Exception:
+        # Unpickling a corrupt or foreign file can raise nearly anything
+        return None
+
+    if not (
+        isinstance(translation, tuple)
+        and len(translation) == 3
+        and all(isinstance(t, list) for t in translation)
+    ):
+        return None
+
+    return translation
+
+
+def store(key: str, translation: Translation) -> None:
+    """
+    Atomically write a translation to the cache. Failures are ignored
+    since the cache is only an optimization
+
+    :param key: the key returned by get_cache_key()
+    :param translation: the functor, bindings, and cast source
+    """
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(translation, f)
+        os.replace(tmp_path, CACHE_DIR / f"{key}.pkl")
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -1,5 +1,4 @@
 import ast
-import copy
 import sys
 from typing import Dict, List, Optional, Set, Tuple, Union
 
@@ -145,7 +144,7 @@ class PyKokkosMembers:
         :returns: two lists, one for the reduction results and one for the timer results
         """
 
-        views = copy.deepcopy(self.views) # Needed since KokkosMainVisitor modifies views
+        views = cppast.fast_clone(self.views) # Needed since KokkosMainVisitor modifies views
 
         # Copied from translate_mains() in bindings.py
         node_visitor = KokkosMainVisitor(
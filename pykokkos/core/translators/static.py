@@ -1,7 +1,10 @@
 import ast
-import copy
+import dataclasses
+import itertools
 import os
 import sys
+import threading
+import weakref
 from typing import Dict, List, Optional, Set, Tuple
 
 from pykokkos.core import cppast
@@ -9,15 +12,36 @@ from pykokkos.core.keywords import Keywords
 from pykokkos.core.optimizations import add_restrict_views
 from pykokkos.core.parsers import PyKokkosEntity, PyKokkosStyles
 from pykokkos.core.visitors import (
-    ClasstypeVisitor, KokkosFunctionVisitor, WorkunitVisitor
+    ClasstypeVisitor, KokkosFunctionVisitor, VisitorContext, WorkunitVisitor, visitors_util
 )
 
-from .bindings import bind_main, bind_workunits
-from .functor import generate_functor
-from .functor_cast import generate_cast
+from . import cache
 from .members import PyKokkosMembers
 from .symbols_pass import SymbolsPass
 
+# The headers included by every generated bindings and cast file
+_FIXED_INCLUDES: str = "".join(f"#include <{h}>\n" for h in (
+    "pybind11/pybind11.h",
+    "Kokkos_Core.hpp",
+    "Kokkos_Random.hpp",
+    "Kokkos_Sort.hpp",
+    "fstream",
+    "iostream",
+    "cmath",
+))
+
+# One Serializer per thread so that its dispatch table is reused
+# across translations
+_serializer_local = threading.local()
+
+def _serializer() -> cppast.Serializer:
+    s: Optional[cppast.Serializer] = getattr(_serializer_local, "serializer", None)
+    if s is None:
+        s = cppast.Serializer()
+        _serializer_local.serializer = s
+
+    return s
+
 def generate_include_guard_start(symbol_name: str):
     include_guard: str = f"#ifndef {symbol_name}\n"
     include_guard += f"#define {symbol_name}\n"
@@ -26,6 +50,45 @@ def generate_include_guard_start(symbol_name: str):
 def generate_include_guard_end() -> str:
     return "\n#endif"
 
+# ASTs whose nodes already carry parent references
+_parented_ASTs: "weakref.WeakSet[ast.AST]" = weakref.WeakSet()
+
+def _shallow_forward_decl(record: cppast.RecordDecl) -> cppast.RecordDecl:
+    """
+    Create a declaration-only copy of a class definition. Only the
+    top-level node is new, all children are shared with the definition
+
+    :param record: the class definition
+    :returns: the forward declaration of the class
+    """
+
+    declaration: cppast.RecordDecl = record.__class__.__new__(record.__class__)
+    declaration.__dict__ = record.__dict__.copy()
+    declaration.is_definition = False
+
+    return declaration
+
+class TranslatorError(Exception):
+    """
+    Raised when one or more workunits fail to translate
+    """
+
+    def __init__(self, errors: List[Tuple[cppast.DeclRefExpr, Exception]]):
+        """
+        TranslatorError Constructor
+
+        :param errors: the name of each failed workunit and the exception it raised
+        """
+
+        self.errors: List[Tuple[cppast.DeclRefExpr, Exception]] = errors
+        messages: List[str] = [f"Translation of workunit {n.declname} failed: {e!r}" for n, e in errors]
+        super().__init__("\n".join(messages))
+
+    def __reduce__(self):
+        # The default pickles self.args, which does not match __init__
+        return (TranslatorError, (self.errors,))
+
+
 class StaticTranslator:
     """
     Translates a PyKokkos workload to C++ using static analysis only
@@ -63,73 +126,121 @@ class StaticTranslator:
 
         self.pk_import = entity.pk_import
 
+        cache_key: Optional[str] = None
+        if cache.is_enabled():
+            cache_key = cache.get_cache_key(
+                entity, self.pk_members, classtypes, restrict_views, (self.module_file, self.functor_file, self.functor_cast))
+            cached: Optional[cache.Translation] = cache.load(cache_key)
+            if cached is not None:
+                # Classtypes are registered as allowed types during translation
+                for c in classtypes:
+                    visitors_util.allowed_types[c.name] = c.name
+                return cached
+
         entity.AST = self.add_parent_refs(entity.AST)
         for c in classtypes:
             c.AST = self.add_parent_refs(c.AST)
-        for f, AST in self.pk_members.pk_functions.items():
-            self.pk_members.pk_functions[f] = self.add_parent_refs(AST)
+        members: PyKokkosMembers = self.pk_members
+        pk_functions = members.pk_functions
+        for f, AST in pk_functions.items():
+            pk_functions[f] = self.add_parent_refs(AST)
 
         # Fusing will rename some symbols so this will not work
         if entity.style is not PyKokkosStyles.fused:
             self.check_symbols(classtypes, entity.path)
 
+        # The code generators are only needed when actually translating,
+        # which is skipped entirely for modules that are already compiled
+        from .functor import generate_functor
+        from .functor_cast import generate_cast
+
         source: Tuple[List[str], int] = entity.source
         functor_name: str = f"pk_functor_{entity.name}"
-        classtypes: List[cppast.RecordDecl] = self.translate_classtypes(classtypes, restrict_views)
-        functions: List[cppast.MethodDecl] = self.translate_functions(source, restrict_views)
+        ctx = VisitorContext(
+            source, members.views, members.pk_workunits, members.fields,
+            pk_functions, members.classtype_methods, self.pk_import,
+            restrict_views, debug=True)
+
+        classtypes: List[cppast.RecordDecl] = self.translate_classtypes(classtypes, ctx)
+        functions: List[cppast.MethodDecl] = self.translate_functions(ctx)
 
         workunits: Dict[cppast.DeclRefExpr, Tuple[str, cppast.MethodDecl]]
         has_rand_call: bool
-        workunits, has_rand_call = self.translate_workunits(source, restrict_views)
+        workunits, has_rand_call = self.translate_workunits(ctx)
 
-        struct: cppast.RecordDecl = generate_functor(functor_name, self.pk_members, workunits, functions, has_rand_call)
+        struct: cppast.RecordDecl = generate_functor(functor_name, members, workunits, functions, has_rand_call)
         if "PK_RESTRICT" in os.environ:
             for operation, workunit in workunits.values():
                 add_restrict_views(struct, operation, workunit, restrict_views)
 
         cast: List[str] = [self.generate_header(), generate_include_guard_start(functor_name.upper()+"_CAST_"+"_HPP")]
         cast.append(self.generate_cast_includes())
-        cast.extend(generate_cast(functor_name,self.pk_members))
+        cast.extend(generate_cast(functor_name, members))
         cast.append(generate_include_guard_end())
 
-        bindings: List[str] = self.generate_bindings(entity, functor_name, source, workunits)
+        bindings: List[str] = [self.generate_header(), self.generate_includes()]
+        bindings.extend(self.generate_bindings(entity, functor_name, source, workunits))
 
-        s = cppast.Serializer()
+        s: cppast.Serializer = _serializer()
         functor: List[str] = [self.generate_header(), generate_include_guard_start(functor_name.upper()+"_HPP")]
         functor.extend([s.serialize(c) for c in classtypes])
         functor.append(s.serialize(struct))
         functor.append(generate_include_guard_end())
 
-        bindings.insert(0, self.generate_includes())
-        bindings.insert(0, self.generate_header())
+        if cache_key is not None:
+            cache.store(cache_key, (functor, bindings, cast))
 
         return functor, bindings, cast
 
     @staticmethod
     def add_parent_refs(classdef: ast.ClassDef) -> ast.ClassDef:
         """
-        Add references to each node's parent node in classdef
+        Add references to each node's parent node in classdef. This is
+        memoized per AST, so any code that modifies an AST in place
+        (e.g. type inference or loop fusion) must call
+        invalidate_parent_refs() on it afterwards, otherwise the next
+        call returns it with stale references
 
         :param classdef: the classdef being modified
         :returns: the modified classdef
         """
 
-        for node in ast.walk(classdef):
-            for child in ast.iter_child_nodes(node):
-                child.parent = node
+        if classdef in _parented_ASTs:
+            return classdef
 
+        stack: List[ast.AST] = [classdef]
+        while stack:
+            node = stack.pop()
             for field_name, child in ast.iter_fields(node):
                 if isinstance(child, ast.AST):
+                    child.parent = node
                     child.parent_accessor = field_name
+                    stack.append(child)
                 elif isinstance(child, list):
                     for idx, grand_child in enumerate(child):
-                        if isinstance(grand_child, str):
+                        if not isinstance(grand_child, ast.AST):
                             continue
+                        grand_child.parent = node
                         grand_child.parent_accessor = field_name
                         grand_child.idx_in_parent = idx
+                        stack.append(grand_child)
+
+        _parented_ASTs.add(classdef)
 
         return classdef
 
+    @staticmethod
+    def invalidate_parent_refs(classdef: ast.AST) -> None:
+        """
+        Mark the parent references of classdef as stale so that the
+        next call to add_parent_refs walks it again. Must be called
+        after modifying an AST in place
+
+        :param classdef: the modified classdef
+        """
+
+        _parented_ASTs.discard(classdef)
+
     def check_symbols(self, classtypes: List[PyKokkosEntity], path: str) -> None:
         """
         Pass over PyKokkos code and make sure that all symbols are
@@ -140,17 +251,16 @@ class StaticTranslator:
         :param path: the path to the file being translated
         """
 
-        symbols_pass = SymbolsPass(self.pk_members, self.pk_import, path)
+        members: PyKokkosMembers = self.pk_members
+        symbols_pass = SymbolsPass(members, self.pk_import, path)
 
-        error_messages: List[str] = []
-        for AST in self.pk_members.pk_mains.values():
-            error_messages.extend(symbols_pass.check_symbols(AST))
-        for AST in self.pk_members.pk_workunits.values():
-            error_messages.extend(symbols_pass.check_symbols(AST))
-        for AST in self.pk_members.pk_functions.values():
-            error_messages.extend(symbols_pass.check_symbols(AST))
-        for entity in classtypes:
-            error_messages.extend(symbols_pass.check_symbols(entity.AST))
+        ASTs = itertools.chain(
+            members.pk_mains.values(),
+            members.pk_workunits.values(),
+            members.pk_functions.values(),
+            (entity.AST for entity in classtypes)
+        )
+        error_messages: List[str] = symbols_pass.check_symbols_batch(ASTs)
 
         if error_messages:
             for error in error_messages:
@@ -159,91 +269,93 @@ class StaticTranslator:
             sys.exit()
 
 
-    def translate_classtypes(self, classtypes: List[PyKokkosEntity], restrict_views: Set[str]) -> List[cppast.RecordDecl]:
+    def translate_classtypes(self, classtypes: List[PyKokkosEntity], ctx: VisitorContext) -> List[cppast.RecordDecl]:
         """
         Translate all classtypes, i.e. classes that the workload uses internally
 
         :param classtypes: the list of classtypes needed by the workload
-        :param restrict_views: the views with the restrict keyword
+        :param ctx: the translation state shared by the visitors
         :returns: a list of strings of translated source code
         """
 
+        if not classtypes:
+            return []
+
         declarations: List[cppast.RecordDecl] = []
         definitions: List[cppast.RecordDecl] = []
 
         for c in classtypes:
             classdef: ast.ClassDef = c.AST
-            source: Tuple[List[str], int] = c.source
 
-            node_visitor = ClasstypeVisitor(
-                {},
-                source, self.pk_members.views, self.pk_members.pk_workunits, self.pk_members.fields,
-                self.pk_members.pk_functions, self.pk_members.classtype_methods, self.pk_import, restrict_views, debug=True
-            )
+            node_visitor = ClasstypeVisitor.from_context(dataclasses.replace(ctx, src=c.source))
 
             definition: cppast.RecordDecl = node_visitor.visit(classdef)
-            declaration = copy.deepcopy(definition)
-            declaration.is_definition = False
+            declaration: cppast.RecordDecl = _shallow_forward_decl(definition)
 
             definitions.append(definition)
             declarations.append(declaration)
 
         return declarations + definitions
 
-    def translate_functions(self, source: Tuple[List[str], int], restrict_views: Set[str]) -> List[cppast.MethodDecl]:
+    def translate_functions(self, ctx: VisitorContext) -> List[cppast.MethodDecl]:
         """
         Translate all PyKokkos functions
 
-        :param source: the python source code of the workload
-        :param restrict_views: the views with the restrict keyword
+        :param ctx: the translation state shared by the visitors
         :returns: a list of method declarations
         """
 
+        if not ctx.kokkos_functions:
+            return []
+
         # The visitor might add views declared as parameters
-        views = copy.deepcopy(self.pk_members.views)
+        views = cppast.fast_clone(ctx.views)
 
-        node_visitor = KokkosFunctionVisitor(
-            {},
-            source, views, self.pk_members.pk_workunits, self.pk_members.fields, self.pk_members.pk_functions,
-            self.pk_members.classtype_methods, self.pk_import, restrict_views, debug=True)
+        node_visitor = KokkosFunctionVisitor.from_context(dataclasses.replace(ctx, views=views))
 
         translation: List[cppast.MethodDecl] = []
 
-        for functiondef in self.pk_members.pk_functions.values():
+        for functiondef in ctx.kokkos_functions.values():
             translation.append(node_visitor.visit(functiondef))
 
         return translation
 
-    def translate_workunits(self, source: Tuple[List[str], int], restrict_views: Set[str]) -> Tuple[Dict[cppast.DeclRefExpr, Tuple[str, cppast.MethodDecl]], bool]:
+    def translate_workunits(self, ctx: VisitorContext) -> Tuple[Dict[cppast.DeclRefExpr, Tuple[str, cppast.MethodDecl]], bool]:
         """
         Translate the workunits
 
-        :param source: the python source code of the workload
-        :param restrict_views: the views with the restrict keyword
+        :param ctx: the translation state shared by the visitors
         :returns: a tuple of a dictionary mapping from workload name
             to a tuple of operation name and source, and a boolean
             indicating whether the workunit has a call to pk.rand()
         """
 
-        node_visitor = WorkunitVisitor(
-            {}, source, self.pk_members.views, self.pk_members.pk_workunits,
-            self.pk_members.fields, self.pk_members.pk_functions,
-            self.pk_members.classtype_methods, self.pk_import, restrict_views, debug=True)
+        if not ctx.work_units:
+            return {}, False
+
+        node_visitor = WorkunitVisitor.from_context(ctx)
 
         workunits: Dict[cppast.DeclRefExpr, Tuple[str, cppast.MethodDecl]] = {}
 
+        errors: List[Tuple[cppast.DeclRefExpr, Exception]] = []
+
         has_rand_call: bool = False
-        for n, w in self.pk_members.pk_workunits.items():
+        for n, w in ctx.work_units.items():
             try:
                 workunits[n] = node_visitor.visit(w)
-                has_rand_call = has_rand_call or node_visitor.has_rand_call
-                if node_visitor.has_rand_call:
-                    workunit: cppast.MethodDecl = workunits[n][1]
-                    self.add_rand_pool_state(workunit)
-                    node_visitor.has_rand_call = False
-            except:
-                print(f"Translation of {w} {w.name} failed")
-                sys.exit(1)
+            except Exception as e:
+                errors.append((n, e))
+                node_visitor.has_rand_call = False
+                continue
+
+            has_rand_call = has_rand_call or node_visitor.has_rand_call
+            if node_visitor.has_rand_call:
+                workunit: cppast.MethodDecl = workunits[n][1]
+                self.add_rand_pool_state(workunit)
+                node_visitor.has_rand_call = False
+
+        if errors:
+            raise TranslatorError(errors) from errors[0][1]
 
         return workunits, has_rand_call
 
@@ -263,20 +375,7 @@ class StaticTranslator:
         :returns: the includes as a string
         """
 
-        headers: List[str] = [
-            "pybind11/pybind11.h",
-            "Kokkos_Core.hpp",
-            "Kokkos_Random.hpp",
-            "Kokkos_Sort.hpp",
-            "fstream",
-            "iostream",
-            "cmath",
-            self.functor_file,
-            self.functor_cast
-        ]
-        headers = [f"#include <{h}>\n" for h in headers]
-
-        return "".join(headers)
+        return f"{_FIXED_INCLUDES}#include <{self.functor_file}>\n#include <{self.functor_cast}>\n"
 
     def generate_cast_includes(self) -> str:
         """
@@ -285,19 +384,7 @@ class StaticTranslator:
         :returns: the includes as a string
         """
 
-        headers: List[str] = [
-            "pybind11/pybind11.h",
-            "Kokkos_Core.hpp",
-            "Kokkos_Random.hpp",
-            "Kokkos_Sort.hpp",
-            "fstream",
-            "iostream",
-            "cmath",
-            self.functor_file
-        ]
-        headers = [f"#include <{h}>\n" for h in headers]
-
-        return "".join(headers)
+        return f"{_FIXED_INCLUDES}#include <{self.functor_file}>\n"
 
     def generate_bindings(
         self,
@@ -315,6 +402,8 @@ class StaticTranslator:
         :returns: the source as a list of strings
         """
 
+        from .bindings import bind_main, bind_workunits
+
         bindings: List[str]
         if entity.style is PyKokkosStyles.workload:
             bindings = bind_main(functor_name, self.pk_members, source, self.pk_import, self.module_file)
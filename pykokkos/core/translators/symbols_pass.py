@@ -1,7 +1,7 @@
 import ast
 from enum import Enum
 import sys
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, Iterable, List, Optional, Set, Union
 
 from pykokkos.core.keywords import Keywords
 from pykokkos.core.visitors.visitors_util import (
@@ -75,7 +75,34 @@ class SymbolsPass:
         :returns: a list of errors (if any)
         """
 
+        return self.check_symbols_batch([AST])
+
+
+    def check_symbols_batch(self, ASTs: Iterable[Union[ast.ClassDef, ast.FunctionDef]]) -> List[str]:
+        """
+        Check all symbols in several ASTs of PyKokkos code in a single
+        pass, collecting the errors of all of them. A node that appears
+        in several of the ASTs is only reported once
+
+        :param ASTs: the parent nodes of the ASTs being checked
+        :returns: a list of errors (if any)
+        """
+
         error_nodes: Dict[ast.AST, ErrorStatus] = {}
+        for AST in ASTs:
+            self.collect_error_nodes(AST, error_nodes)
+
+        return self.get_error_messages(error_nodes)
+
+
+    def collect_error_nodes(self, AST: Union[ast.ClassDef, ast.FunctionDef], error_nodes: Dict[ast.AST, ErrorStatus]) -> None:
+        """
+        Add the nodes of an AST that use invalid symbols to error_nodes
+
+        :param AST: the parent node of AST
+        :param error_nodes: a map from the nodes containing invalid symbols to the error status
+        """
+
         local_symbols = self.get_local_symbols(AST)
 
         for node in ast.walk(AST):
@@ -90,9 +117,6 @@ class SymbolsPass:
                 error_nodes[node] = ErrorStatus.reserved
 
 
-        return self.get_error_messages(error_nodes)
-
-
     def get_local_symbols(self, AST: Union[ast.ClassDef, ast.FunctionDef]) -> Set[str]:
         """
         Get a set of all symbols used in an AST locally
@@ -220,7 +220,7 @@ class KokkosMainVisitor(PyKokkosVisitor):
         call: Union[cppast.ArraySubscriptExpr, cppast.CallExpr] = super().visit_Subscript(node)
         if isinstance(call, cppast.CallExpr):
             view_name: str = call.function.declname
-            call._function._declname = f"pk_d_{view_name}"
+            call._function._declname = cppast.intern_name(f"pk_d_{view_name}")
 
         return call
 
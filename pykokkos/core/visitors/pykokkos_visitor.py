@@ -3,13 +3,19 @@ from ast import FunctionDef, AST
 import os
 import re
 import sys
-from typing import List, Dict, Optional, Set, Union
+from typing import Callable, List, Dict, Optional, Set, Tuple, Union
 
 from pykokkos.core import cppast
 from pykokkos.core.optimizations import adjust_kokkos_function_call, get_restrict_ptr_name, index_restrict_view
 from pykokkos.interface import View
 
 from . import visitors_util
+from .visitor_context import VisitorContext
+
+
+# Maps from (visitor class, node class) to the visit_* method handling
+# it, shared by all the visitors translating an entity
+_dispatch_cache: Dict[Tuple[type, type], Callable] = {}
 
 
 class PyKokkosVisitor(ast.NodeVisitor):
@@ -43,6 +49,31 @@ class PyKokkosVisitor(ast.NodeVisitor):
         # Maps from nested work unit name to definition
         self.nested_work_units: Dict[str, cppast.LambdaExpr] = {}
 
+    @classmethod
+    def from_context(cls, ctx: VisitorContext) -> "PyKokkosVisitor":
+        """
+        Create a visitor with an empty environment from the shared
+        translation state
+
+        :param ctx: the translation state shared by the visitors
+        :returns: the new visitor
+        """
+
+        return cls(
+            {}, ctx.src, ctx.views, ctx.work_units, ctx.fields, ctx.kokkos_functions,
+            ctx.dependency_methods, ctx.pk_import, ctx.restrict_views, ctx.debug)
+
+    def visit(self, node: AST):
+        # Same as ast.NodeVisitor.visit() but without building the
+        # method name and looking it up again for every node
+        key = (self.__class__, node.__class__)
+        method: Optional[Callable] = _dispatch_cache.get(key)
+        if method is None:
+            method = getattr(self.__class__, f"visit_{node.__class__.__name__}", self.__class__.generic_visit)
+            _dispatch_cache[key] = method
+
+        return method(self, node)
+
     def visit_arguments(self, node: ast.arguments) -> List[cppast.ParmVarDecl]:
         args: List[cppast.ParmVarDecl] = [self.visit(a) for a in node.args if a.arg != "self"]
 
@@ -0,0 +1,22 @@
+from ast import FunctionDef
+from dataclasses import dataclass
+from typing import Dict, List, Set, Tuple
+
+from pykokkos.core import cppast
+
+
+@dataclass(frozen=True)
+class VisitorContext:
+    """
+    The translation state shared by the visitors of a single entity
+    """
+
+    src: Tuple[List[str], int]
+    views: Dict[cppast.DeclRefExpr, cppast.Type]
+    work_units: Dict[str, FunctionDef]
+    fields: Dict[cppast.DeclRefExpr, cppast.PrimitiveType]
+    kokkos_functions: Dict[str, FunctionDef]
+    dependency_methods: Dict[str, List[str]]
+    pk_import: str
+    restrict_views: Set[str]
+    debug: bool = False
@@ -222,7 +222,7 @@ class WorkunitVisitor(PyKokkosVisitor):
             try:
                 decltype.typename = f"const {decltype.typename}"
             except AttributeError:
-                decltype._type = f"const {decltype.typename.value}"
+                decltype._type = cppast.intern_name(f"const {decltype.typename.value}")
 
             decltype.is_reference = True
 
@@ -10,6 +10,8 @@ import pytest
 cwd = os.getcwd()
 shutil.rmtree(os.path.join(cwd, "pk_cpp"),
               ignore_errors=True)
+# and bypass the on-disk translation cache
+os.environ.pop("PK_TRANSLATOR_CACHE", None)
 
 from tests import _logging_probe
 
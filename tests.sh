@@ -2,6 +2,9 @@ readonly _DIR=$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )
 readonly TESTS_DIR="${_DIR}"/tests
 readonly RC_FILE="${_DIR}"/.coveragerc
 
+# always exercise the translator
+unset PK_TRANSLATOR_CACHE
+
 coverage run --rcfile="${RC_FILE}" -m unittest discover -s "${TESTS_DIR}"
 coverage report
 coverage xml -o cov.xml
\ No newline at end of file
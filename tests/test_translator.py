@@ -0,0 +1,194 @@
+import ast
+import copy
+import os
+from pathlib import Path
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+import pykokkos as pk
+from pykokkos.core import cppast
+from pykokkos.core.compiler import Compiler
+from pykokkos.core.parsers import Parser
+from pykokkos.core.translators import StaticTranslator, TranslatorError, cache
+from pykokkos.core.type_inference import UpdatedTypes
+from pykokkos.core.visitors import VisitorContext
+
+
+# Tests for the translator passes that do not require compiling C++
+@pk.workunit
+def untyped_workunit(tid, view):
+    view[tid] = tid
+
+
+@pk.function
+def cached_helper(x: int) -> int:
+    return x + 1
+
+
+@pk.workunit
+def cached_workunit(tid: int, view: pk.View1D[pk.int32]):
+    view[tid] = cached_helper(tid)
+
+
+@pk.workunit
+def scaled_workunit(tid: int, view: pk.View1D[pk.int32]):
+    view[tid] = 2 * tid
+
+
+# CPython reuses a single instance of these nodes (e.g. ast.Load) across
+# every tree, so their parent is whichever node was visited last
+SHARED_NODES = (ast.expr_context, ast.operator, ast.boolop, ast.cmpop, ast.unaryop)
+
+
+class TestParentRefs(unittest.TestCase):
+    def assert_parented(self, AST: ast.AST) -> None:
+        for node in ast.walk(AST):
+            for field_name, child in ast.iter_fields(node):
+                children = child if isinstance(child, list) else [child]
+                for idx, grand_child in enumerate(children):
+                    if not isinstance(grand_child, ast.AST) or isinstance(grand_child, SHARED_NODES):
+                        continue
+
+                    self.assertIs(getattr(grand_child, "parent", None), node)
+                    self.assertEqual(grand_child.parent_accessor, field_name)
+                    if isinstance(child, list):
+                        self.assertEqual(grand_child.idx_in_parent, idx)
+
+    def test_fix_types(self):
+        parser = Parser(__file__)
+        entity = parser.get_entity("untyped_workunit")
+        StaticTranslator.add_parent_refs(entity.AST)
+
+        updated_types = UpdatedTypes(untyped_workunit, {"tid": "int", "view": "View1D:double"}, [])
+        Compiler().fix_entity(parser, entity, updated_types, None)
+
+        StaticTranslator.add_parent_refs(entity.AST)
+        self.assert_parented(entity.AST)
+
+    def test_loop_fuse(self):
+        path: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "loop_fusion_kernels.py")
+        entity = Parser(path).get_entity("nested_doubles")
+        StaticTranslator.add_parent_refs(entity.AST)
+
+        with mock.patch.dict(os.environ, {"PK_LOOP_FUSE": "1"}):
+            Compiler().optimize_entity(entity)
+
+        StaticTranslator.add_parent_refs(entity.AST)
+        self.assert_parented(entity.AST)
+
+
+class TestTranslatorCache(unittest.TestCase):
+    def get_key(self, entity, members) -> str:
+        return cache.get_cache_key(entity, members, [], set(), ("module", "functor.hpp", "functor_cast.hpp"))
+
+    def test_called_function_changes_key(self):
+        entity = Parser(__file__).get_entity("cached_workunit")
+        members = Compiler().extract_members(entity, [])
+        key: str = self.get_key(entity, members)
+        self.assertEqual(key, self.get_key(entity, members))
+
+        # The function is not part of the workunit AST or source
+        helper: ast.FunctionDef = next(f for f in members.pk_functions.values() if f.name == "cached_helper")
+        helper.body[0].value.right = ast.Constant(value=2)
+
+        self.assertNotEqual(key, self.get_key(entity, members))
+
+    def test_invalid_entries(self):
+        with tempfile.TemporaryDirectory() as cache_dir, mock.patch.object(cache, "CACHE_DIR", Path(cache_dir)):
+            translation = (["functor"], ["bindings"], ["cast"])
+            cache.store("valid", translation)
+            self.assertEqual(cache.load("valid"), translation)
+
+            (Path(cache_dir) / "corrupt.pkl").write_bytes(b"\x80\x04not a pickle")
+            self.assertIsNone(cache.load("corrupt"))
+
+            (Path(cache_dir) / "wrong_shape.pkl").write_bytes(pickle.dumps(["functor", "bindings"]))
+            self.assertIsNone(cache.load("wrong_shape"))
+
+            self.assertIsNone(cache.load("missing"))
+
+
+class FailingWorkunitVisitor:
+    """Fails on every workunit except cached_workunit"""
+
+    def __init__(self):
+        self.has_rand_call: bool = False
+
+    @classmethod
+    def from_context(cls, ctx: VisitorContext) -> "FailingWorkunitVisitor":
+        return cls()
+
+    def visit(self, node: ast.FunctionDef):
+        if node.name != "cached_workunit":
+            raise ValueError(f"cannot translate {node.name}")
+
+        return "parallel_for", None
+
+
+class TestTranslatorError(unittest.TestCase):
+    def test_every_failed_workunit(self):
+        names = ["untyped_workunit", "cached_workunit", "scaled_workunit"]
+        parser = Parser(__file__)
+        work_units = {cppast.DeclRefExpr(n): parser.get_entity(n).AST for n in names}
+
+        entity = parser.get_entity("cached_workunit")
+        members = Compiler().extract_members(entity, [])
+        translator = StaticTranslator("module", "functor.hpp", "functor_cast.hpp", members)
+        ctx = VisitorContext(entity.source, {}, work_units, {}, {}, {}, "pk", set())
+
+        with mock.patch("pykokkos.core.translators.static.WorkunitVisitor", FailingWorkunitVisitor):
+            with self.assertRaises(TranslatorError) as cm:
+                translator.translate_workunits(ctx)
+
+        failed = [n.declname for n, _ in cm.exception.errors]
+        self.assertEqual(failed, ["untyped_workunit", "scaled_workunit"])
+        self.assertIsInstance(cm.exception.__cause__, ValueError)
+        for name in failed:
+            self.assertIn(f"Translation of workunit {name} failed", str(cm.exception))
+        self.assertNotIn("cached_workunit", str(cm.exception))
+
+    def test_pickle(self):
+        error = TranslatorError([(cppast.DeclRefExpr("workunit"), ValueError("cannot translate workunit"))])
+        unpickled: TranslatorError = pickle.loads(pickle.dumps(error))
+
+        self.assertEqual(str(unpickled), str(error))
+        self.assertEqual(unpickled.errors[0][0].declname, "workunit")
+        self.assertIsInstance(unpickled.errors[0][1], ValueError)
+
+
+class TestFastClone(unittest.TestCase):
+    def test_views(self):
+        view_type = cppast.ClassType("View1D")
+        view_type.add_template_param(cppast.PrimitiveType(cppast.BuiltinType.INT))
+        other_type = cppast.ClassType("View2D")
+        other_type.add_template_param(cppast.PrimitiveType(cppast.BuiltinType.DOUBLE))
+
+        # Fused views share the type of the original view
+        views = {
+            cppast.DeclRefExpr("view"): view_type,
+            cppast.DeclRefExpr("fused_view_0"): view_type,
+            cppast.DeclRefExpr("other"): other_type,
+        }
+
+        s = cppast.Serializer()
+        expected = copy.deepcopy(views)
+        cloned = cppast.fast_clone(views)
+
+        self.assertEqual(
+            [(s.serialize(k), s.serialize(v)) for k, v in cloned.items()],
+            [(s.serialize(k), s.serialize(v)) for k, v in expected.items()])
+
+        view, fused, other = cloned.values()
+        self.assertIs(view, fused)
+        self.assertIsNot(view, view_type)
+        self.assertIsNot(other.template_params[0], other_type.template_params[0])
+
+        # Visitors mutate the copies in place
+        view.is_reference = True
+        self.assertFalse(view_type.is_reference)
+
+
+if __name__ == "__main__":
+    unittest.main()